@@ -3,6 +3,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    from .sentiment import coarse_sentiment, is_coarse_sentiment
+except ImportError:
+    # modules sitting flat next to each other instead of under src/
+    from sentiment import coarse_sentiment, is_coarse_sentiment
+
 def summarize_dataset(trades_df: pd.DataFrame, sentiment_df: pd.DataFrame):
     print("Trades shape:", trades_df.shape)
     print("Sentiment shape:", sentiment_df.shape)
@@ -13,16 +19,10 @@ def summarize_dataset(trades_df: pd.DataFrame, sentiment_df: pd.DataFrame):
 
 def compare_by_sentiment(merged_df: pd.DataFrame, save_fig: str = None):
     df = merged_df.copy()
-    def coarse(c):
-        if pd.isna(c): 
-            return "Unknown"
-        c = str(c).lower()
-        if "fear" in c:
-            return "Fear"
-        if "greed" in c:
-            return "Greed"
-        return "Other"
-    df['sentiment_coarse'] = df['classification'].apply(coarse)
+    # only reuse a precomputed column if it holds the known labels
+    # (merge_with_sentiment's fillna(0) can leave 0s in it)
+    if 'sentiment_coarse' not in df.columns or not is_coarse_sentiment(df['sentiment_coarse']):
+        df['sentiment_coarse'] = coarse_sentiment(df['classification'])
     stat = df.groupby('sentiment_coarse').agg(
         mean_daily_pnl = ('daily_pnl','mean'),
         median_daily_pnl = ('daily_pnl','median'),
@@ -7,22 +7,37 @@ from sklearn.metrics import accuracy_score, classification_report, mean_squared_
 import joblib
 from pathlib import Path
 
+try:
+    from .ranking import RANK_FEATURE_COLS, cross_sectional_ranks
+    from .sentiment import REGIME_FEATURE_COLS, attach_sentiment_features, sentiment_code
+except ImportError:
+    # modules sitting flat next to each other instead of under src/
+    from ranking import RANK_FEATURE_COLS, cross_sectional_ranks
+    from sentiment import REGIME_FEATURE_COLS, attach_sentiment_features, sentiment_code
+
 MODEL_DIR = Path("models")
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
-def prepare_features(merged_df: pd.DataFrame, lag_days: int = 1):
+def prepare_features(merged_df: pd.DataFrame, lag_days: int = 1, sentiment_features: pd.DataFrame = None,
+                     rank_features: bool = False):
 
     df = merged_df.copy()
+    if sentiment_features is not None:
+        df = attach_sentiment_features(df, sentiment_features)
+    if rank_features:
+        # always re-rank: an input ranked on another cross-section (e.g. a
+        # filtered slice) would be stale; rank before outlier trimming
+        df = cross_sectional_ranks(df)
     df = df.sort_values(['account','date'])
 
     lower = df['daily_pnl'].quantile(0.01)
     upper = df['daily_pnl'].quantile(0.99)
     df = df[df['daily_pnl'].between(lower, upper)]
 
-    df['sentiment_code'] = df['classification'].fillna("Unknown") \
-        .astype(str) \
-        .apply(lambda x: 1 if 'greed' in x.lower()
-               else (-1 if 'fear' in x.lower() else 0))
+    # a sentiment_code carried in on the input may be stale; only trust one
+    # that attach_sentiment_features supplied in this call
+    if sentiment_features is None or 'sentiment_code' not in sentiment_features.columns:
+        df['sentiment_code'] = sentiment_code(df['classification'])
 
     df['next_daily_pnl'] = df.groupby('account')['daily_pnl'].shift(-1)
 
@@ -45,6 +60,9 @@ def prepare_features(merged_df: pd.DataFrame, lag_days: int = 1):
         'winrate_lag1',
         'tradecount_roll3'
     ]
+    feature_cols += [c for c in REGIME_FEATURE_COLS if c in df.columns]
+    if rank_features:
+        feature_cols += RANK_FEATURE_COLS
 
     X = df[feature_cols].fillna(0)
     y = df['target_profit_next']
@@ -0,0 +1,138 @@
+import pandas as pd
+import numpy as np
+
+RANK_METRICS = ['daily_pnl', 'win_rate', 'trade_count']
+
+RANK_FEATURE_COLS = [f'{m}_xs_rank' for m in RANK_METRICS]
+
+
+# ====================================
+# PARTIAL SELECTION
+# ====================================
+def _top_n_positions(values: np.ndarray, n: int, ascending: bool = False) -> np.ndarray:
+
+    # NaNs are pushed past every real value so they never make the cut
+    keys = np.where(np.isnan(values), np.inf, values if ascending else -values)
+    n = min(n, len(keys))
+    if n <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    # argpartition is O(len); only the n winners get sorted
+    pos = np.argpartition(keys, n - 1)[:n]
+    return pos[np.argsort(keys[pos], kind='stable')]
+
+
+def top_n_accounts(
+    daily_df: pd.DataFrame,
+    n: int = 10,
+    metric: str = 'daily_pnl',
+    ascending: bool = False
+) -> pd.DataFrame:
+
+    means = daily_df.groupby('account', sort=False)[metric].mean()
+    pos = _top_n_positions(means.to_numpy(dtype=float), n, ascending)
+    return means.iloc[pos].reset_index()
+
+
+# ====================================
+# CROSS-SECTIONAL RANKS PER DATE
+# ====================================
+def cross_sectional_ranks(daily_df: pd.DataFrame, metrics=None) -> pd.DataFrame:
+
+    if metrics is None:
+        metrics = RANK_METRICS
+
+    df = daily_df.copy()
+
+    # percentile rank of each account within its day, 1.0 = best
+    ranks = df.groupby('date')[metrics].rank(method='average', pct=True)
+    df[[f'{m}_xs_rank' for m in metrics]] = ranks.to_numpy()
+
+    return df
+
+
+# ====================================
+# RUNNING LEADERBOARD
+# ====================================
+class AccountLeaderboard:
+
+    def __init__(self, metrics=None):
+        self.metrics = list(RANK_METRICS if metrics is None else metrics)
+        self._index = {}
+        self._accounts = []
+        self._sums = np.zeros((0, len(self.metrics)))
+        self._counts = np.zeros((0, len(self.metrics)), dtype=np.int64)
+        self._days = np.zeros(0, dtype=np.int64)
+        self._seen = pd.MultiIndex.from_arrays(
+            [pd.Index([], dtype=object), pd.DatetimeIndex([])], names=['account', 'date']
+        )
+
+    def update(self, daily_df: pd.DataFrame):
+
+        # (account, date) keys already folded in are skipped, so replayed or
+        # overlapping batches are no-ops while backfilled days still count
+        keys = pd.MultiIndex.from_arrays(
+            [daily_df['account'], pd.to_datetime(daily_df['date'])], names=['account', 'date']
+        )
+        is_new = ~keys.isin(self._seen) & ~keys.duplicated()
+        if not is_new.any():
+            return self
+        fresh = daily_df[is_new]
+        self._seen = self._seen.append(keys[is_new])
+
+        # only the new rows are aggregated, then folded into the running totals
+        g = fresh.groupby('account', sort=False)
+        sums = g[self.metrics].sum()
+        counts = g[self.metrics].count()
+        days = g.size()
+
+        new = [a for a in sums.index if a not in self._index]
+        if new:
+            for a in new:
+                self._index[a] = len(self._accounts)
+                self._accounts.append(a)
+            self._sums = np.vstack([self._sums, np.zeros((len(new), len(self.metrics)))])
+            self._counts = np.vstack([self._counts, np.zeros((len(new), len(self.metrics)), dtype=np.int64)])
+            self._days = np.concatenate([self._days, np.zeros(len(new), dtype=np.int64)])
+
+        idx = np.fromiter((self._index[a] for a in sums.index), dtype=np.int64, count=len(sums))
+        self._sums[idx] += sums.to_numpy(dtype=float)
+        self._counts[idx] += counts.to_numpy()
+        self._days[idx] += days.to_numpy()
+
+        return self
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def _means(self, metric: str) -> np.ndarray:
+        # NaN metric values are left out of both the sum and the count
+        i = self.metrics.index(metric)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._sums[:, i] / self._counts[:, i]
+
+    def means(self) -> pd.DataFrame:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = self._sums / self._counts
+        df = pd.DataFrame(values, columns=self.metrics)
+        df.insert(0, 'account', self._accounts)
+        df['active_days'] = self._days
+        return df
+
+    def top_n(self, n: int = 10, metric: str = 'daily_pnl', ascending: bool = False) -> pd.DataFrame:
+        values = self._means(metric)
+        pos = _top_n_positions(values, n, ascending)
+        return pd.DataFrame({
+            'account': [self._accounts[i] for i in pos],
+            metric: values[pos],
+        })
+
+    def percentile_rank(self, account, metric: str = 'daily_pnl') -> float:
+
+        # share of accounts at or below this one, a single O(n) comparison
+        values = self._means(metric)
+        v = values[self._index[account]]
+        valid = values[~np.isnan(values)]
+        if np.isnan(v) or len(valid) == 0:
+            return np.nan
+        return float((valid <= v).mean())
@@ -0,0 +1,91 @@
+import pandas as pd
+import numpy as np
+
+SENTIMENT_CODES = {"Fear": -1, "Greed": 1, "Other": 0, "Unknown": 0}
+
+REGIME_FEATURE_COLS = [
+    'days_since_regime_change',
+    'regime_streak',
+    'sentiment_roll',
+]
+
+
+# ====================================
+# COARSE LABELS (VECTORIZED)
+# ====================================
+def _coarse_label(c):
+    if pd.isna(c):
+        return "Unknown"
+    c = str(c).lower()
+    # "fear" wins over "greed" if a label ever contains both
+    if "fear" in c:
+        return "Fear"
+    if "greed" in c:
+        return "Greed"
+    return "Other"
+
+
+def is_coarse_sentiment(labels: pd.Series) -> bool:
+    return bool(labels.isin(SENTIMENT_CODES.keys()).all())
+
+
+def coarse_sentiment(classification: pd.Series) -> pd.Series:
+    # only the distinct labels are string-scanned, rows are mapped by code
+    # (NaN gets code -1, which picks up the trailing "Unknown")
+    codes, uniques = pd.factorize(classification)
+    labels = np.array([_coarse_label(u) for u in uniques] + ["Unknown"], dtype=object)
+    return pd.Series(labels[codes], index=classification.index, name='sentiment_coarse')
+
+
+def sentiment_code(classification: pd.Series) -> pd.Series:
+    coarse = coarse_sentiment(classification)
+    return coarse.map(SENTIMENT_CODES).astype(int).rename('sentiment_code')
+
+
+# ====================================
+# ENCODE SENTIMENT TABLE + REGIMES
+# ====================================
+def encode_sentiment(sentiment_df: pd.DataFrame, roll_window: int = 7) -> pd.DataFrame:
+
+    df = sentiment_df.sort_values('date').reset_index(drop=True)
+
+    df['sentiment_coarse'] = coarse_sentiment(df['classification'])
+    df['sentiment_code'] = df['sentiment_coarse'].map(SENTIMENT_CODES).astype(int)
+
+    # a new regime starts whenever the coarse label flips
+    regime_id = (df['sentiment_coarse'] != df['sentiment_coarse'].shift()).cumsum()
+    regime_start = df.groupby(regime_id)['date'].transform('min')
+
+    df['days_since_regime_change'] = (df['date'] - regime_start).dt.days
+    df['regime_streak'] = df.groupby(regime_id).cumcount() + 1
+
+    df['sentiment_roll'] = (
+        df['sentiment_code']
+        .rolling(roll_window, min_periods=1)
+        .mean()
+    )
+
+    return df
+
+
+# ====================================
+# JOIN ONTO ACCOUNT-DAY ROWS
+# ====================================
+def attach_sentiment_features(
+    metrics_df: pd.DataFrame,
+    encoded_df: pd.DataFrame
+) -> pd.DataFrame:
+
+    # drop any stale copies so the join doesn't produce _x/_y suffixes
+    cols = [c for c in encoded_df.columns if c != 'date']
+    df = metrics_df.drop(columns=[c for c in cols if c in metrics_df.columns])
+
+    df = df.merge(encoded_df, on='date', how='left')
+
+    # account-days with no sentiment row fall back to the neutral bucket
+    if 'sentiment_coarse' in df.columns:
+        df['sentiment_coarse'] = df['sentiment_coarse'].fillna("Unknown")
+    if 'sentiment_code' in df.columns:
+        df['sentiment_code'] = df['sentiment_code'].fillna(0).astype(int)
+
+    return df
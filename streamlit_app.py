@@ -2,6 +2,12 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 
+try:
+    from src.ranking import AccountLeaderboard, top_n_accounts
+except ImportError:
+    # modules sitting flat next to the app instead of under src/
+    from ranking import AccountLeaderboard, top_n_accounts
+
 # --- CONFIG & STYLING ---
 st.set_page_config(page_title="Trader Sentiment Explorer", layout="wide", page_icon="📈")
 
@@ -24,6 +30,10 @@ def load_data():
     df['date'] = pd.to_datetime(df['date'])
     return df
 
+@st.cache_resource
+def load_leaderboard():
+    return AccountLeaderboard().update(load_data())
+
 def main():
     try:
         data = load_data()
@@ -115,7 +125,12 @@ def main():
     # Render the Left Column with the standard filtered data
     with bot_left:
         st.subheader("🏆 Top Performers")
-        top = filtered_data.groupby('account')['daily_pnl'].mean().reset_index().sort_values('daily_pnl', ascending=False).head(10)
+        if sel == "All" and isinstance(dr, (list, tuple)) and tuple(dr) == (min_d, max_d):
+            # unfiltered view: served from the cached running leaderboard
+            top = load_leaderboard().top_n(10, metric='daily_pnl')
+        else:
+            # sentiment/date filters change per request, so rank the filtered rows
+            top = top_n_accounts(filtered_data, n=10, metric='daily_pnl')
         st.dataframe(top, use_container_width=True, hide_index=True)
 
     # Render the Right Column with EXPLICIT INSIGHTS & ACTIONABLE OUTPUT